@@ -33,6 +33,26 @@ class FrameState:
             "dpad": tuple(self.dpad),
         }
 
+    def with_axis(self, idx: int, value: float) -> "FrameState":
+        """Return a copy with one axis replaced.
+
+        Preferred over the list-mutate-retuple roundtrip in modifiers:
+        the slice-concat builds the new tuple in one C-level op.
+        """
+        return FrameState(
+            buttons=self.buttons,
+            axes=self.axes[:idx] + (value,) + self.axes[idx + 1:],
+            dpad=self.dpad,
+        )
+
+    def with_button(self, idx: int, value: bool) -> "FrameState":
+        """Return a copy with one button replaced."""
+        return FrameState(
+            buttons=self.buttons[:idx] + (value,) + self.buttons[idx + 1:],
+            axes=self.axes,
+            dpad=self.dpad,
+        )
+
     @staticmethod
     def _normalize_values(obj: Dict[str, Any]) -> Dict[str, Any]:
         out = {
@@ -45,13 +65,21 @@ class FrameState:
             return out
 
         buttons = obj.get("buttons")
-        if isinstance(buttons, (list, tuple)):
+        if type(buttons) is tuple and len(buttons) == 10 and all(type(x) is bool for x in buttons):
+            # Fast path: already a correctly-shaped bool tuple, no coercion
+            out["buttons"] = buttons
+        elif isinstance(buttons, (list, tuple)):
             b = [bool(x) for x in buttons]
             b = (b + [False] * 10)[:10]
             out["buttons"] = b
 
         axes = obj.get("axes")
-        if isinstance(axes, (list, tuple)):
+        if (type(axes) is tuple and len(axes) == 6
+                and all(type(x) is float for x in axes)
+                and max(map(abs, axes)) <= 1.0):
+            # Fast path: valid float tuple already in range, no clamping
+            out["axes"] = axes
+        elif isinstance(axes, (list, tuple)):
             def _to_float_clamped(x):
                 try:
                     v = float(x)
@@ -80,14 +108,32 @@ class FrameState:
         data = cls._different_input(obj) if False else cls._normalize_values(obj)
         return cls(buttons=tuple(data["buttons"]), axes=tuple(data["axes"]), dpad=tuple(data["dpad"]))
 
+    @classmethod
+    def from_trusted(cls, buttons: Tuple[bool, ...], axes: Tuple[float, ...],
+                     dpad: Tuple[int, int]) -> "FrameState":
+        """Build a FrameState from already-validated tuples, skipping normalization.
+
+        Fast path for trusted producers (e.g. generators that guarantee
+        correctly-shaped, clamped values). External or untrusted data should
+        go through `from_dict()` instead.
+        """
+        return cls(buttons=buttons, axes=axes, dpad=dpad)
+
     @staticmethod
     def _different_input(obj: Dict[str, Any]) -> Dict[str, Any]:
         return FrameState._normalize_values(obj)
 
 
+# Shared neutral frame. FrameState is immutable, so hot-path fallbacks
+# and default_state() can hand this out instead of allocating.
+_DEFAULT_FRAME_STATE = FrameState()
+
+
 class BaseModule(ABC):
     def default_state(self) -> FrameState:
-        return FrameState()
+        # Safe to share: FrameState is frozen and to_dict() returns a
+        # fresh dict, so callers can't affect each other through it.
+        return _DEFAULT_FRAME_STATE
 
 
 class BaseGenerator(BaseModule, ABC):
@@ -31,16 +31,23 @@ class DebugViewer:
         self.left_tag = left_tag
         self.show_second_screen = show_second_screen
         self.right_tag = right_tag
-        self._q: "queue.Queue" = queue.Queue()
+        # Bounded hand-off from the poll thread: one slot per panel tag.
+        # If the render thread falls behind, the oldest frame is dropped
+        # rather than letting the backlog (and viewer lag) grow unbounded.
+        self._q: "queue.Queue" = queue.Queue(maxsize=2)
         self._thread = None
         self._running = False
         self.width = width
         self.height = height
 
         self._latest = {self.left_tag: None, self.right_tag: None}
+        self._dirty = True  # force the initial "<no data>" draw
+        self._label_cache = {}  # (text, color) -> rendered surface
 
     def enqueue(self, tag: str, state: FrameState):
         try:
+            if self._q.full():
+                self._q.get_nowait()  # drop-oldest: latest frame wins
             self._q.put_nowait((tag, state.to_dict()))
         except Exception:
             pass
@@ -66,9 +73,23 @@ class DebugViewer:
             try:
                 tag, sd = self._q.get_nowait()
                 self._latest[tag] = sd
+                self._dirty = True
             except Exception:
                 break
 
+    def _label(self, font, text: str, color) -> "pygame.Surface":
+        """Return a cached rendered surface for a static label.
+
+        font.render is software rasterization and dominates panel draw
+        cost; static strings (button labels, titles) are rendered once.
+        """
+        key = (text, color)
+        surf = self._label_cache.get(key)
+        if surf is None:
+            surf = font.render(text, True, color)
+            self._label_cache[key] = surf
+        return surf
+
     def _run(self):
         pygame.init()
         screen = pygame.display.set_mode((self.width, self.height))
@@ -81,25 +102,30 @@ class DebugViewer:
             right_rect = pygame.Rect(left_rect.right + 10, 10, left_rect.width, left_rect.height)
 
         while self._running:
-            # quit on q pressed 
-
-            if pygame.key.get_pressed()[pygame.K_q]:
-                self._running = False
-                
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self._running = False
+                elif event.type == pygame.KEYDOWN and event.key == pygame.K_q:
+                    # quit on q pressed
+                    self._running = False
 
             self._drain_queue()
 
-            screen.fill((16, 16, 16))
+            # Only repaint when a new frame actually arrived
+            if self._dirty:
+                screen.fill((16, 16, 16))
+
+                self._draw_panel(screen, left_rect, font, self.left_tag, self._latest.get(self.left_tag))
 
-            self._draw_panel(screen, left_rect, font, self.left_tag, self._latest.get(self.left_tag))
+                if self.show_second_screen:
+                    self._draw_panel(screen, right_rect, font, self.right_tag, self._latest.get(self.right_tag))
 
-            if self.show_second_screen:
-                self._draw_panel(screen, right_rect, font, self.right_tag, self._latest.get(self.right_tag))
+                # Full flip: panel drawing blits value text outside the
+                # panel rects, so a partial update would freeze those
+                # readouts. The dirty-flag skip already bounds idle cost.
+                pygame.display.flip()
+                self._dirty = False
 
-            pygame.display.flip()
             clock.tick(30)
 
         pygame.quit()
@@ -108,14 +134,14 @@ class DebugViewer:
         # background
         pygame.draw.rect(surf, (28, 28, 28), rect)
         # title
-        title_s = font.render(title, True, (220, 220, 220))
+        title_s = self._label(font, title, (220, 220, 220))
         surf.blit(title_s, (rect.x + 6, rect.y + 6))
 
         inner_x = rect.x + 8
         inner_y = rect.y + 30
 
         if sd is None:
-            txt = font.render("<no data>", True, (180, 180, 180))
+            txt = self._label(font, "<no data>", (180, 180, 180))
             surf.blit(txt, (inner_x, inner_y))
             return
 
@@ -150,7 +176,7 @@ class DebugViewer:
 
                 # Draw label centered on the button
                 label = BUTTON_LABELS[i] if i < len(BUTTON_LABELS) else str(i)
-                lbl_surf = font.render(label, True, (255, 255, 255) if pressed else (220, 220, 220))
+                lbl_surf = self._label(font, label, (255, 255, 255) if pressed else (220, 220, 220))
                 lw, lh = lbl_surf.get_size()
                 lx = x + (btn_w - lw) // 2
                 ly = y + (btn_h - lh) // 2
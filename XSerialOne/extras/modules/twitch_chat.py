@@ -71,14 +71,45 @@ class TwitchEventQueue:
     def __init__(self):
         self._queue = deque()
         self._lock = threading.Lock()
+        self._ready = threading.Event()
 
     def enqueue(self, event: TwitchEvent):
         with self._lock:
             self._queue.append(event)
+            self._ready.set()
 
     def dequeue(self) -> Optional[TwitchEvent]:
         with self._lock:
-            return self._queue.popleft() if self._queue else None
+            event = self._queue.popleft() if self._queue else None
+            if not self._queue:
+                self._ready.clear()
+            return event
+
+    def drain(self) -> tuple:
+        """Atomically take and return all queued events, oldest first.
+
+        One lock acquisition for the whole batch (and for the idle empty
+        check), versus two per event with is_empty()/dequeue() loops.
+        """
+        with self._lock:
+            if not self._queue:
+                return ()
+            events = tuple(self._queue)
+            self._queue.clear()
+            self._ready.clear()
+            return events
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until at least one event is queued (or timeout elapses).
+
+        Returns True if the queue is (probably) non-empty. May wake
+        spuriously after wake(); callers should handle dequeue() -> None.
+        """
+        return self._ready.wait(timeout)
+
+    def wake(self):
+        """Release any thread blocked in wait(), e.g. on shutdown."""
+        self._ready.set()
 
     def is_empty(self) -> bool:
         with self._lock:
@@ -91,6 +122,7 @@ class TwitchEventQueue:
     def clear(self):
         with self._lock:
             self._queue.clear()
+            self._ready.clear()
 
 
 # ============================================================
@@ -223,6 +255,13 @@ class EventSubListener:
             "Waste Ultimate": ("y", 0.1),
         }
 
+        # O(1) dispatch on subscription type instead of chained comparisons
+        self._event_handlers = {
+            "channel.channel_points_custom_reward_redemption.add": self._on_reward,
+            "channel.cheer": self._on_cheer,
+            "channel.subscribe": self._on_subscribe,
+        }
+
     def start(self):
         self._thread = threading.Thread(target=self._run_loop, daemon=True)
         self._thread.start()
@@ -267,26 +306,27 @@ class EventSubListener:
                 logger.error(f"Failed to subscribe {t}: {r.status_code} {r.text}")
 
     async def _handle_event(self, payload):
-        event = payload["event"]
-        etype = payload["subscription"]["type"]
-
-        if etype == "channel.channel_points_custom_reward_redemption.add":
-            print("Reward redeemed:", event)
-            title = event["reward"]["title"]
-            if title in self.REWARD_COMMANDS:
-                cmd, decay = self.REWARD_COMMANDS[title]
-                self.queue.enqueue(TwitchEvent("channel_points", event.get("user_name", ""), cmd, time.time(), {"decay": decay, "source": EventSource.POINTS}))
-
-        elif etype == "channel.cheer":
-            bits = event["bits"]
-            username = event.get("user_name", "")
-            if bits >= 100:
-                self.queue.enqueue(TwitchEvent("cheer", username, "hold shoot", time.time(), {"decay": 2.0, "source": EventSource.CHEER}))
-            elif bits >= 10:
-                self.queue.enqueue(TwitchEvent("cheer", username, "shoot", time.time(), {"decay": 0.1, "source": EventSource.CHEER}))
-
-        elif etype == "channel.subscribe":
-            self.queue.enqueue(TwitchEvent("subscribe", event.get("user_name", ""), "jump", time.time(), {"decay": 0.1, "source": EventSource.SUB}))
+        handler = self._event_handlers.get(payload["subscription"]["type"])
+        if handler is not None:
+            handler(payload["event"])
+
+    def _on_reward(self, event):
+        print("Reward redeemed:", event)
+        title = event["reward"]["title"]
+        if title in self.REWARD_COMMANDS:
+            cmd, decay = self.REWARD_COMMANDS[title]
+            self.queue.enqueue(TwitchEvent("channel_points", event.get("user_name", ""), cmd, time.time(), {"decay": decay, "source": EventSource.POINTS}))
+
+    def _on_cheer(self, event):
+        bits = event["bits"]
+        username = event.get("user_name", "")
+        if bits >= 100:
+            self.queue.enqueue(TwitchEvent("cheer", username, "hold shoot", time.time(), {"decay": 2.0, "source": EventSource.CHEER}))
+        elif bits >= 10:
+            self.queue.enqueue(TwitchEvent("cheer", username, "shoot", time.time(), {"decay": 0.1, "source": EventSource.CHEER}))
+
+    def _on_subscribe(self, event):
+        self.queue.enqueue(TwitchEvent("subscribe", event.get("user_name", ""), "jump", time.time(), {"decay": 0.1, "source": EventSource.SUB}))
 
     async def _main(self):
         try:
@@ -342,6 +382,21 @@ class TwitchChatListener:
     def on_message_received(self, event: TwitchEvent):
         self.queue.enqueue(event)
 
+    def get_message(self, timeout: float = 0.1) -> Optional[TwitchEvent]:
+        """Block until an event arrives or the timeout elapses.
+
+        Waits on the queue's ready event rather than sleep-polling, so
+        messages are picked up immediately and stop() wakes a blocked
+        caller without waiting out the timeout.
+        """
+        if self.queue.wait(timeout):
+            return self.queue.dequeue()
+        return None
+
+    def stop(self):
+        self.is_running = False
+        self.queue.wake()
+
 
 # ============================================================
 # INPUT MODIFIER
@@ -361,10 +416,7 @@ class TwitchInputModifier(BaseModifier):
         self.button_actions[button] = action
 
     def update(self, state: FrameState) -> FrameState:
-        while not self.queue.is_empty():
-            event = self.queue.dequeue()
-            if event is None:
-                break
+        for event in self.queue.drain():
             if event.event_type == "chat":
                 action = self.chat_actions.get(event.message.lower())
                 if action is not None:
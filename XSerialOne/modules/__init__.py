@@ -3,6 +3,7 @@
 from .anti_afk import AntiAFKModifier
 from .antirecoil import BasicAntiRecoilModifier
 from .deadzones import DeadzoneModifier, HairTriggers
+from .fused import FusedAimModifier
 from .sequence_playback import SequencePlaybackGenerator, SequenceRecordingGenerator
 from .xinput import XInputGenerator
 
@@ -10,6 +11,7 @@ __all__ = [
     "XInputGenerator",
     "BasicAntiRecoilModifier",
     "DeadzoneModifier", "HairTriggers",
+    "FusedAimModifier",
     "SequencePlaybackGenerator", "SequenceRecordingGenerator",
     "AntiAFKModifier",
 ]
@@ -0,0 +1,65 @@
+"""
+_jit.py
+Author: Ellie V.
+
+Optional Numba-compiled kernel for the hot aim-modifier math.
+
+The deadzone / anti-recoil / hair-trigger chain is scalar float math over
+six axes, executed once per pipeline tick. This module fuses the three
+stages into a single kernel operating in place on a flat float64 NumPy
+buffer, compiled with numba.njit when Numba is installed. Without Numba
+the same function runs as plain Python, so behavior is identical either
+way and numba stays an optional dependency.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator stand-in when numba is unavailable."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True, nogil=True)
+def recoil_deadzone_hair(axes, dz_left, dz_right, recoil_strength,
+                         trigger_threshold, hair_threshold):
+    """Apply deadzone -> anti-recoil -> hair-trigger in one pass, in place.
+
+    `axes` is a 6-element float64 array in frame axis order. Semantics
+    match chaining DeadzoneModifier, BasicAntiRecoilModifier, and
+    HairTriggers in that order.
+    """
+    # Per-axis deadzones (axial, matching DeadzoneModifier.update)
+    if abs(axes[0]) < dz_left:
+        axes[0] = 0.0
+    if abs(axes[1]) < dz_left:
+        axes[1] = 0.0
+    if abs(axes[2]) < dz_right:
+        axes[2] = 0.0
+    if abs(axes[3]) < dz_right:
+        axes[3] = 0.0
+
+    # Anti-recoil: push right stick Y by trigger-scaled recoil force
+    rt = axes[5]
+    if rt >= trigger_threshold:
+        axes[3] = axes[3] + abs(recoil_strength) * rt
+
+    # Hair trigger: snap RT to full press / full release
+    if rt > hair_threshold:
+        axes[5] = 1.0
+    else:
+        axes[5] = -1.0
+
+
+def warmup():
+    """Trigger JIT compilation once at startup so the first real frame
+    doesn't pay the compile latency. No-op without numba."""
+    buf = np.zeros(6, dtype=np.float64)
+    recoil_deadzone_hair(buf, 0.2, 0.2, 0.3, 0.1, 0.1)
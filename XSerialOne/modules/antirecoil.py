@@ -10,8 +10,6 @@ counter weapon recoil patterns. The modifier preserves original stick
 movement while adding vertical compensation when firing.
 """
 
-import math
-
 from XSerialOne.base import BaseModifier, FrameState
 from XSerialOne.frame_constants import Axis
 
@@ -23,20 +21,20 @@ class BasicAntiRecoilModifier(BaseModifier):
         self.trigger_threshold = 0.1  
         
     def update(self, state: FrameState) -> FrameState:
-        axes = list(state.axes)
-        
-        right_x = axes[Axis.RIGHTSTICKX] 
-        right_y = axes[Axis.RIGHTSTICKY] 
-        
-        rt = axes[Axis.RIGHTTRIGGER]
-        if rt >= self.trigger_threshold:
-            recoil_force = abs(self.recoil_strength) * (rt / 1.0)
-            current_magnitude = math.sqrt(right_x * right_x + right_y * right_y)
-            
-            if current_magnitude > 0.01: 
-                axes[Axis.RIGHTSTICKX] = right_x  
-                axes[Axis.RIGHTSTICKY] = right_y + recoil_force  
-            else:
-                axes[Axis.RIGHTSTICKY] = axes[Axis.RIGHTSTICKY] + recoil_force
-
-        return FrameState(buttons=state.buttons, axes=tuple(axes), dpad=state.dpad)
\ No newline at end of file
+        rt = state.axes[Axis.RIGHTTRIGGER]
+        if rt < self.trigger_threshold:
+            return state  # not firing: no compensation, no rebuild
+
+        axes = state.axes
+
+        # Compensation is the same whether or not the stick is deflected,
+        # so no magnitude check is needed: X passes through, Y gets the
+        # trigger-scaled recoil force.
+        recoil_force = abs(self.recoil_strength) * (rt / 1.0)
+        new_y = axes[Axis.RIGHTSTICKY] + recoil_force
+
+        return FrameState(
+            buttons=state.buttons,
+            axes=axes[:Axis.RIGHTSTICKY] + (new_y,) + axes[Axis.RIGHTSTICKY + 1:],
+            dpad=state.dpad,
+        )
\ No newline at end of file
@@ -54,6 +54,11 @@ class DeadzoneModifier(BaseModifier):
             deadzone_right = deadzone
         self.deadzone_left = deadzone_left
         self.deadzone_right = deadzone_right
+        self._deadzones = (deadzone_left, deadzone_left, deadzone_right, deadzone_right)
+        # Single-slot memo: sticks are usually static between frames, so
+        # remember the last input axes and their deadzoned result
+        self._last_axes = None
+        self._last_sticks = None
 
     def _apply_circular_deadzone(self, x, y, deadzone):
         mag = math.sqrt(x**2 + y**2)
@@ -66,11 +71,17 @@ class DeadzoneModifier(BaseModifier):
             return (x / mag) * scale, (y / mag) * scale
 
     def update(self, state: FrameState) -> FrameState:
-        axes = list(state.axes)
-        deadzones = [self.deadzone_left] * 2 + [self.deadzone_right] * 2
-        new_axes = [0.0 if abs(axes[i]) < deadzones[i] else axes[i] for i in range(4)]
-        new_axes.extend(axes[4:])
-        return FrameState(buttons=state.buttons, axes=tuple(new_axes), dpad=state.dpad)
+        axes = state.axes
+        if axes == self._last_axes:
+            sticks = self._last_sticks
+        else:
+            sticks = tuple(0.0 if abs(a) < dz else a
+                           for a, dz in zip(axes, self._deadzones))
+            self._last_axes = axes
+            self._last_sticks = sticks
+        if sticks == axes[:4]:
+            return state  # sticks outside deadzone: nothing to rebuild
+        return FrameState(buttons=state.buttons, axes=sticks + axes[4:], dpad=state.dpad)
     
 
 
@@ -80,10 +91,12 @@ class HairTriggers(BaseModifier):
         self.threshold = threshold
 
     def update(self, state: FrameState) -> FrameState:
-        axes = list(state.axes)
-        rt = axes[Axis.RIGHTTRIGGER]
-        if rt > self.threshold:
-            axes[Axis.RIGHTTRIGGER] = 1.0
-        else:
-            axes[Axis.RIGHTTRIGGER] = -1.0
-        return FrameState(buttons=state.buttons, axes=tuple(axes), dpad=state.dpad)
\ No newline at end of file
+        rt = state.axes[Axis.RIGHTTRIGGER]
+        snapped = 1.0 if rt > self.threshold else -1.0
+        if rt == snapped:
+            return state  # already fully pressed/released
+        return FrameState(
+            buttons=state.buttons,
+            axes=state.axes[:Axis.RIGHTTRIGGER] + (snapped,),
+            dpad=state.dpad,
+        )
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""
+fused.py
+Author: Ellie V.
+
+Fused aim-modifier chain for the XSerialOne framework.
+
+Chaining DeadzoneModifier, BasicAntiRecoilModifier, and HairTriggers
+allocates up to three FrameStates per frame. FusedAimModifier applies
+the same three stages in one pass over one working buffer and builds a
+single FrameState, using the Numba-compiled kernel from `_jit` when
+Numba is installed.
+"""
+
+import numpy as np
+
+from XSerialOne.base import BaseModifier, FrameState
+from XSerialOne.modules._jit import HAS_NUMBA, recoil_deadzone_hair, warmup
+
+
+class FusedAimModifier(BaseModifier):
+    """Deadzone -> anti-recoil -> hair-trigger in a single pass.
+
+    Drop-in replacement for registering the three separate modifiers in
+    that order; parameters mirror theirs. Output is identical to the
+    chained modifiers for every input.
+    """
+
+    def __init__(self, deadzone_left=0.2, deadzone_right=0.2,
+                 recoil_strength=0.3, trigger_threshold=0.1,
+                 hair_threshold=0.1):
+        super().__init__()
+        self.deadzone_left = deadzone_left
+        self.deadzone_right = deadzone_right
+        self.recoil_strength = recoil_strength
+        self.trigger_threshold = trigger_threshold
+        self.hair_threshold = hair_threshold
+        if HAS_NUMBA:
+            # Preallocated scratch the jitted kernel mutates in place;
+            # warm up now so the first frame doesn't pay JIT latency.
+            self._buf = np.empty(6, dtype=np.float64)
+            warmup()
+
+    def update(self, state: FrameState) -> FrameState:
+        axes = state.axes
+
+        if HAS_NUMBA:
+            buf = self._buf
+            buf[:] = axes
+            recoil_deadzone_hair(buf, self.deadzone_left, self.deadzone_right,
+                                 self.recoil_strength, self.trigger_threshold,
+                                 self.hair_threshold)
+            new_axes = tuple(buf.tolist())
+        else:
+            a = list(axes)
+            if abs(a[0]) < self.deadzone_left:
+                a[0] = 0.0
+            if abs(a[1]) < self.deadzone_left:
+                a[1] = 0.0
+            if abs(a[2]) < self.deadzone_right:
+                a[2] = 0.0
+            if abs(a[3]) < self.deadzone_right:
+                a[3] = 0.0
+            rt = a[5]
+            if rt >= self.trigger_threshold:
+                a[3] = a[3] + abs(self.recoil_strength) * rt
+            a[5] = 1.0 if rt > self.hair_threshold else -1.0
+            new_axes = tuple(a)
+
+        if new_axes == axes:
+            return state
+        return FrameState(buttons=state.buttons, axes=new_axes, dpad=state.dpad)
@@ -10,7 +10,7 @@ configurable speed and looping behavior.
 
 import time
 
-from XSerialOne.base import BaseGenerator, FrameState
+from XSerialOne.base import _DEFAULT_FRAME_STATE, BaseGenerator, FrameState
 from XSerialOne.sequence import Sequence
 
 
@@ -44,7 +44,9 @@ class SequencePlaybackGenerator(BaseGenerator):
         self.start_time: float = None
         self.is_playing = False
         self.current_frame_index = 0
-    
+        self._states = None  # per-frame FrameStates, converted once lazily
+        self._states_src = None  # frames list the cache was built from
+
     def start(self):
         """Start playback."""
         self.start_time = time.time()
@@ -78,13 +80,13 @@ class SequencePlaybackGenerator(BaseGenerator):
     def generate(self) -> FrameState:
         """Generate the current frame based on playback position."""
         if not self.is_playing or self.sequence is None or not self.sequence.frames:
-            return FrameState()
-        
+            return _DEFAULT_FRAME_STATE
+
         if self.start_time is None:
             self.start_time = time.time()
-        
+
         elapsed_ms = self.get_position_ms()
-        
+
         # Check if sequence is complete
         if elapsed_ms > self.sequence.duration_ms:
             if self.loop:
@@ -94,23 +96,28 @@ class SequencePlaybackGenerator(BaseGenerator):
             else:
                 # Sequence finished
                 self.is_playing = False
-                return FrameState()
-        
-        # Find the appropriate frame
-        if not self.sequence.frames:
-            return FrameState()
-        
+                return _DEFAULT_FRAME_STATE
+
+        frames = self.sequence.frames
+
+        # Convert each frame dict to a FrameState once, not per tick;
+        # rebuild whenever the frames list itself is a different object
+        # (sequence swapped) or its length changed (frames added/removed).
+        if self._states_src is not frames or len(self._states) != len(frames):
+            self._states = [FrameState.from_dict(f.frame) for f in frames]
+            self._states_src = frames
+
         # Linear search for the frame at this timestamp
         # In future, could use binary search for large sequences
-        current_frame = self.sequence.frames[0]
-        
-        for frame in self.sequence.frames:
+        index = 0
+
+        for i, frame in enumerate(frames):
             if frame.timestamp_ms <= elapsed_ms:
-                current_frame = frame
+                index = i
             else:
                 break
-        
-        return FrameState.from_dict(current_frame.frame)
+
+        return self._states[index]
 
 
 class SequenceRecordingGenerator(BaseGenerator):
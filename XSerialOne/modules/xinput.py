@@ -12,12 +12,54 @@ for reliable controller input processing.
 
 import ctypes
 import logging
-from typing import Any, Dict, Optional
+import struct
+import time
+from typing import Any, Optional, Tuple
 
-from XSerialOne.base import BaseGenerator, FrameState
+from XSerialOne.base import _DEFAULT_FRAME_STATE, BaseGenerator, FrameState
 
 logger = logging.getLogger(__name__)
 
+# XINPUT_STATE layout: DWORD dwPacketNumber, then XINPUT_GAMEPAD
+# {WORD wButtons, BYTE bLeftTrigger, BYTE bRightTrigger,
+#  SHORT sThumbLX, sThumbLY, sThumbRX, sThumbRY} - 16 bytes total.
+_GAMEPAD = struct.Struct('<IHBBhhhh')
+
+# wButtons masks in frame button order (A, B, X, Y, LB, RB, BACK, START, LS, RS)
+_BTN_MASKS = (0x1000, 0x2000, 0x4000, 0x8000,
+              0x0100, 0x0200, 0x0020, 0x0010, 0x0040, 0x0080)
+
+# Union of the masks above: the wButtons bits that affect button state
+_BTN_BITS = 0xF3F0
+
+# wButtons (masked) -> decoded button tuple, memoized lazily. At most
+# 1024 combinations exist; the cap guards the degenerate case anyway.
+_BUTTONS_BY_MASK = {}
+
+
+def _build_dpad_lut():
+    """Precompute (hx, hy) for every low-nibble dpad combination.
+
+    Bits 0-3 of wButtons are UP, DOWN, LEFT, RIGHT; opposing bits sum
+    to neutral (a real dpad can't press both anyway).
+    """
+    lut = []
+    for nibble in range(16):
+        hx = (-1 if nibble & 0x04 else 0) + (1 if nibble & 0x08 else 0)
+        hy = (1 if nibble & 0x01 else 0) + (-1 if nibble & 0x02 else 0)
+        lut.append((hx, hy))
+    return tuple(lut)
+
+
+# Low nibble of wButtons -> dpad tuple; one index instead of four bit tests
+_DPAD_LUT = _build_dpad_lut()
+
+# Hoisted normalization constants. Raw shorts span [-32768, 32767] and
+# trigger bytes [0, 255], so scaling alone keeps results in [-1, 1] with
+# no clamping needed.
+_STICK_SCALE = 1.0 / 32768.0
+_TRIGGER_SCALE = 1.0 / 127.5
+
 class XInputError(Exception):
     """Base exception for XInput-related errors."""
     pass
@@ -51,6 +93,23 @@ class XInputGenerator(BaseGenerator):
         self.ERROR_SUCCESS = 0
         self.ERROR_DEVICE_NOT_CONNECTED = 1167
         self._last_error = self.ERROR_SUCCESS
+
+        # Reusable XINPUT_STATE buffer: read_xinput runs allocation-free
+        # instead of creating a fresh ctypes buffer per 1 kHz poll
+        self._state_buf = ctypes.create_string_buffer(20)
+        self._state_ref = ctypes.byref(self._state_buf)
+        self._state_mv = memoryview(self._state_buf)
+
+        # XInputGetState on a disconnected slot is a multi-millisecond call
+        # on Windows; after a disconnect, skip polling for a grace period
+        self._absent_until = 0.0
+        self._absent_retry_interval = 1.0
+
+        # RawInput presence probe: with no input devices enumerated at
+        # all, polling XInput every frame is pure cost. Re-probed on the
+        # same ~1s cadence as the disconnect skip above.
+        self._devices_present = self._probe_devices_present()
+        self._presence_recheck_at = time.monotonic() + self._absent_retry_interval
         
     @staticmethod
     def _load_xinput_dll() -> Optional[Any]:
@@ -67,14 +126,35 @@ class XInputGenerator(BaseGenerator):
                 logger.debug(f"Failed to load {dll}: {e}")
         return None
         
+    @staticmethod
+    def _probe_devices_present() -> bool:
+        """Check whether any raw input devices are enumerated at all.
+
+        Returns True whenever the probe is unavailable or inconclusive
+        (non-Windows, mocked DLLs, API failure) so polling proceeds
+        normally in those environments.
+        """
+        try:
+            count = ctypes.c_uint(0)
+            # NULL list pointer: query the device count only
+            res = ctypes.windll.user32.GetRawInputDeviceList(
+                None, ctypes.byref(count),
+                ctypes.sizeof(ctypes.c_void_p) * 2)
+            if res != 0:
+                return True
+            return count.value > 0
+        except Exception:
+            return True
+
     def is_connected(self) -> bool:
         """Check if the controller is currently connected.
         
         Returns:
             True if the controller is connected, False otherwise
         """
-        state = ctypes.create_string_buffer(20)
-        result = self.xinput.XInputGetState(self.controller_id, ctypes.byref(state))
+        # Reuse the persistent XINPUT_STATE buffer; the contents are
+        # overwritten by the next read_xinput anyway
+        result = self.xinput.XInputGetState(self.controller_id, self._state_ref)
         self._last_error = result
         return result == self.ERROR_SUCCESS
         
@@ -107,58 +187,47 @@ class XInputGenerator(BaseGenerator):
         except (TypeError, ValueError):
             return 0.0
 
-    def read_xinput(self) -> Dict[str, Any]:
+    def read_xinput(self) -> Tuple[tuple, tuple, tuple]:
         """Read the current state of the controller.
-        
+
         Returns:
-            Dict containing buttons, axes, and dpad states
+            Tuple of (buttons, axes, dpad) tuples, ready for
+            `FrameState.from_trusted()`
         """
-        state = ctypes.create_string_buffer(20)
         buttons = [False]*10
         axes = [0.0]*6
         dpad = (0, 0)
 
         try:
-            res = self.xinput.XInputGetState(self.controller_id, ctypes.byref(state))
+            res = self.xinput.XInputGetState(self.controller_id, self._state_ref)
             self._last_error = res
-            
-            if res == self.ERROR_SUCCESS and len(state.raw) >= 16:
+
+            if res == self.ERROR_SUCCESS:
                 try:
-                    wButtons = int.from_bytes(state.raw[4:6], 'little')
-                    
-                    # Map buttons using order from BUTTON_MAP
-                    for i, (_, mask) in enumerate(self.BUTTON_MAP.items()):
-                        buttons[i] = bool(wButtons & mask)
+                    # Parse the whole XINPUT_STATE in one C-level unpack
+                    (_packet, wButtons, lt_raw, rt_raw,
+                     lx, ly, rx, ry) = _GAMEPAD.unpack_from(self._state_mv)
 
-                    # Process triggers with safety checks
-                    lt = self._normalize_trigger(state.raw[6])
-                    rt = self._normalize_trigger(state.raw[7])
-                    
-                    # Process sticks with safety checks
-                    try:
-                        leftX = self._normalize_stick(
-                            ctypes.c_short.from_buffer_copy(state.raw[8:10]).value)
-                        leftY = -self._normalize_stick(
-                            ctypes.c_short.from_buffer_copy(state.raw[10:12]).value)
-                        rightX = self._normalize_stick(
-                            ctypes.c_short.from_buffer_copy(state.raw[12:14]).value)
-                        rightY = -self._normalize_stick(
-                            ctypes.c_short.from_buffer_copy(state.raw[14:16]).value)
-                    except (ValueError, BufferError) as e:
-                        logger.warning(f"Error processing stick values: {e}")
-                        leftX = leftY = rightX = rightY = 0.0
-
-                    axes = [leftX, leftY, rightX, rightY, lt, rt]
-
-                    # Process DPAD
-                    hx, hy = 0, 0
-                    if wButtons & 0x0001: hy = 1   # DPAD UP
-                    if wButtons & 0x0002: hy = -1  # DPAD DOWN
-                    if wButtons & 0x0004: hx = -1  # DPAD LEFT
-                    if wButtons & 0x0008: hx = 1   # DPAD RIGHT
-                    dpad = (hx, hy)
+                    # Decode buttons through the memo: repeat combinations
+                    # (usually "nothing pressed") cost one dict lookup
+                    key = wButtons & _BTN_BITS
+                    cached = _BUTTONS_BY_MASK.get(key)
+                    if cached is None:
+                        # Same order as BUTTON_MAP, kept for introspection
+                        cached = tuple((wButtons & m) != 0 for m in _BTN_MASKS)
+                        if len(_BUTTONS_BY_MASK) < 1024:
+                            _BUTTONS_BY_MASK[key] = cached
+                    buttons = cached
+
+                    # Inline scaling: no per-axis method call or clamp needed
+                    axes = [lx * _STICK_SCALE, -ly * _STICK_SCALE,
+                            rx * _STICK_SCALE, -ry * _STICK_SCALE,
+                            (lt_raw - 127.5) * _TRIGGER_SCALE,
+                            (rt_raw - 127.5) * _TRIGGER_SCALE]
+
+                    dpad = _DPAD_LUT[wButtons & 0x0F]
                     
-                except (IndexError, ValueError) as e:
+                except (IndexError, ValueError, struct.error) as e:
                     logger.error(f"Error processing XInput state: {e}")
             
             elif res == self.ERROR_DEVICE_NOT_CONNECTED:
@@ -167,7 +236,7 @@ class XInputGenerator(BaseGenerator):
         except Exception as e:
             logger.error(f"XInput read failed: {e}")
 
-        return {"buttons": buttons, "axes": axes, "dpad": dpad}
+        return tuple(buttons), tuple(axes), dpad
 
     def generate(self) -> FrameState:
         """Generate a new frame state from the current controller state.
@@ -177,11 +246,28 @@ class XInputGenerator(BaseGenerator):
         """
         if not self.xinput:
             logger.error("No XInput DLL available")
-            return self.default_state()
-            
+            return _DEFAULT_FRAME_STATE
+
+        if not self._devices_present:
+            # No input devices enumerated: skip XInput entirely, re-probe
+            # presence on the retry cadence
+            now = time.monotonic()
+            if now < self._presence_recheck_at:
+                return _DEFAULT_FRAME_STATE
+            self._devices_present = self._probe_devices_present()
+            self._presence_recheck_at = now + self._absent_retry_interval
+            if not self._devices_present:
+                return _DEFAULT_FRAME_STATE
+
+        if time.monotonic() < self._absent_until:
+            # Controller was absent on a recent poll; don't re-query yet
+            return _DEFAULT_FRAME_STATE
+
         try:
-            raw = self.read_xinput()
-            return FrameState.from_dict(raw)
+            state = FrameState.from_trusted(*self.read_xinput())
+            if self._last_error == self.ERROR_DEVICE_NOT_CONNECTED:
+                self._absent_until = time.monotonic() + self._absent_retry_interval
+            return state
         except Exception as e:
             logger.error(f"Error generating frame state: {e}")
-            return self.default_state()
\ No newline at end of file
+            return _DEFAULT_FRAME_STATE
\ No newline at end of file
@@ -10,23 +10,34 @@ communication with XSerialOne hardware. It provides a flexible pipeline
 architecture for real-time input processing and modification.
 """
 
+import asyncio
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from XSerialOne.serial_interface import SerialInterface
 
 
 class InputPipeline:
-    def __init__(self, serial_port=None, baud=115200, send_interval=0.005):
+    def __init__(self, serial_port=None, baud=115200, send_interval=0.005,
+                 min_poll_interval_s=0.001, idle_poll_interval_s=0.008):
         """
         Handles generators -> modifiers -> serial output
+
+        run_loop paces itself between min_poll_interval_s (input actively
+        changing) and idle_poll_interval_s (frames static), bounding idle
+        CPU without adding latency while sticks are moving.
         """
         self.generators = []
         self.modifiers = []
         self.send_interval = send_interval
-        self.last_send = 0
-        self.tick_rate = 0.001
+        self._send_interval_ns = int(send_interval * 1_000_000_000)
+        self._last_send_ns = 0
+        self.min_poll_interval_s = min_poll_interval_s
+        self.idle_poll_interval_s = idle_poll_interval_s
+        self.tick_rate = min_poll_interval_s
 
         self.serial = SerialInterface(serial_port, baud) if serial_port else None
+        self._io_pool = None  # lazy; only run_loop_async needs it
 
         self._on_generate_callbacks = []
         self._on_post_mod_callbacks = []
@@ -42,14 +53,48 @@ class InputPipeline:
 
         Callback signature: cb(frame_state)
         """
-        self._on_generate_callbacks.append(cb)
+        # Copy-on-write: rebind instead of append so update() can iterate
+        # the list directly without a per-frame defensive copy.
+        self._on_generate_callbacks = self._on_generate_callbacks + [cb]
 
     def add_post_mod_callback(self, cb):
         """Register a callback called after modifiers have been applied.
 
         Callback signature: cb(frame_state)
         """
-        self._on_post_mod_callbacks.append(cb)
+        self._on_post_mod_callbacks = self._on_post_mod_callbacks + [cb]
+
+    def compile_modifiers(self):
+        """Collapse a known modifier chain into its fused equivalent.
+
+        A consecutive DeadzoneModifier -> BasicAntiRecoilModifier ->
+        HairTriggers run is replaced with one FusedAimModifier carrying
+        the same parameters: one pass and one FrameState per frame
+        instead of three. Any other chain is left untouched.
+
+        Returns True if a substitution was made.
+        """
+        # Local imports: pipeline stays importable without the modules package
+        from XSerialOne.modules.antirecoil import BasicAntiRecoilModifier
+        from XSerialOne.modules.deadzones import DeadzoneModifier, HairTriggers
+        from XSerialOne.modules.fused import FusedAimModifier
+
+        mods = self.modifiers
+        for i in range(len(mods) - 2):
+            dz, ar, ht = mods[i], mods[i + 1], mods[i + 2]
+            if (type(dz) is DeadzoneModifier
+                    and type(ar) is BasicAntiRecoilModifier
+                    and type(ht) is HairTriggers):
+                fused = FusedAimModifier(
+                    deadzone_left=dz.deadzone_left,
+                    deadzone_right=dz.deadzone_right,
+                    recoil_strength=ar.recoil_strength,
+                    trigger_threshold=ar.trigger_threshold,
+                    hair_threshold=ht.threshold,
+                )
+                self.modifiers = mods[:i] + [fused] + mods[i + 3:]
+                return True
+        return False
 
     def combine_generators(self):
         """
@@ -72,17 +117,16 @@ class InputPipeline:
             state = mod.update(state)
         return state
 
-    def update(self, now=None):
-        """
-        Generate a frame, apply modifiers, and send via SerialInterface if configured.
+    def _process_frame(self):
+        """Generate one frame, fire callbacks, and apply modifiers.
+
+        Shared by the sync and async loops; does not touch the serial port.
         """
-        if now is None:
-            now = time.perf_counter()
         state = self.combine_generators()
         if state is None:
             return None
 
-        for cb in list(self._on_generate_callbacks):
+        for cb in self._on_generate_callbacks:
             try:
                 cb(state)
             except Exception:
@@ -90,44 +134,125 @@ class InputPipeline:
 
         state = self.apply_modifiers(state)
 
-        for cb in list(self._on_post_mod_callbacks):
+        for cb in self._on_post_mod_callbacks:
             try:
                 cb(state)
             except Exception:
                 pass
 
-        if self.serial and now - self.last_send >= self.send_interval:
-            self.serial.send_frame(state)
-            self.last_send = now
+        return state
+
+    def update(self, now=None):
+        """
+        Generate a frame, apply modifiers, and send via SerialInterface if configured.
+
+        `now` is accepted for backward compatibility; send pacing uses the
+        monotonic clock internally.
+        """
+        state = self._process_frame()
+        if state is None:
+            return None
+
+        if self.serial:
+            # Integer nanosecond compare on a monotonic clock: cheaper than
+            # float arithmetic and immune to wall-clock jumps.
+            now_ns = time.monotonic_ns()
+            if now_ns - self._last_send_ns >= self._send_interval_ns:
+                self.serial.send_frame(state)
+                self._last_send_ns = now_ns
 
         return state
 
     def run_loop(self):
         """
         Continuous loop for pipeline updates with a precise, drift-compensated tick.
+
+        The tick period adapts to activity: once a few consecutive updates
+        produce identical frames, polling backs off to idle_poll_interval_s;
+        any change snaps it back to min_poll_interval_s.
         """
-        target_interval = self.tick_rate
-        last_time = time.perf_counter()
-        next_tick = last_time
+        period = self.min_poll_interval_s
+        next_tick = time.monotonic() + period
+        last_state = None
+        idle_streak = 0
 
         try:
             while True:
-                now = time.perf_counter()
-                last_time = now
+                state = self.update()
+                if state is not None and state == last_state:
+                    idle_streak += 1
+                else:
+                    idle_streak = 0
+                last_state = state
 
-                if now >= next_tick:
-                    self.update(now)
-                    next_tick += target_interval
+                period = (self.idle_poll_interval_s if idle_streak >= 4
+                          else self.min_poll_interval_s)
 
-                    # If behind, catch up
-                    if now - next_tick > target_interval:
-                        next_tick = now + target_interval
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                    next_tick += period
                 else:
-                    sleep_time = max(0.0, next_tick - now)
-                    if sleep_time > 0:
-                        time.sleep(sleep_time)
+                    # Fell behind (update took longer than a tick): realign
+                    # to now instead of bursting to catch up.
+                    next_tick = time.monotonic() + period
         except KeyboardInterrupt:
             if self.serial:
                 self.serial.close()
             print("Pipeline stopped")
 
+    async def run_loop_async(self):
+        """
+        Async variant of run_loop that moves serial writes off the poll path.
+
+        Polling (generate -> modifiers) runs on the event loop; frames are
+        handed to a sender task through a 2-deep queue and written on a
+        dedicated single-thread executor, so a stalled USB write overlaps
+        the next poll instead of delaying it. On overflow the oldest frame
+        is dropped, bounding input-to-output latency.
+
+        Run with: asyncio.run(pipeline.run_loop_async())
+        """
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="xserial-io")
+
+        loop = asyncio.get_running_loop()
+        out_queue = asyncio.Queue(maxsize=2)
+
+        async def _send_task():
+            while True:
+                state = await out_queue.get()
+                await loop.run_in_executor(
+                    self._io_pool, self.serial.send_frame, state)
+
+        sender = asyncio.ensure_future(_send_task()) if self.serial else None
+
+        try:
+            last_state = None
+            idle_streak = 0
+            while True:
+                state = self._process_frame()
+                if state is not None and state == last_state:
+                    idle_streak += 1
+                else:
+                    idle_streak = 0
+                last_state = state
+
+                if state is not None and self.serial:
+                    now_ns = time.monotonic_ns()
+                    if now_ns - self._last_send_ns >= self._send_interval_ns:
+                        if out_queue.full():
+                            out_queue.get_nowait()  # drop-oldest
+                        out_queue.put_nowait(state)
+                        self._last_send_ns = now_ns
+
+                await asyncio.sleep(
+                    self.idle_poll_interval_s if idle_streak >= 4
+                    else self.min_poll_interval_s)
+        finally:
+            if sender:
+                sender.cancel()
+            if self.serial:
+                self.serial.close()
+
@@ -10,13 +10,27 @@ transmitting controller state data, including button states, analog
 values, and d-pad positions.
 """
 
+import collections
 import struct
+import threading
+import time
 from dataclasses import dataclass
 
 import serial
 
 from XSerialOne.base import FrameState
 
+# Full wire frame: header, button bitmask, 6 axes, dpad code, checksum.
+_PKT = struct.Struct('<BHffffffBB')
+
+# Button tuple -> bitmask, memoized lazily. Only 1024 patterns exist for
+# the 10-button layout; the cap guards against degenerate inputs.
+_BUTTONS_LUT = {}
+
+# All 9 dpad positions, precomputed.
+_DPAD_LUT = {(hx, hy): (hx + 1) + (hy + 1) * 3
+             for hx in (-1, 0, 1) for hy in (-1, 0, 1)}
+
 
 @dataclass
 class Packet:
@@ -27,49 +41,160 @@ class Packet:
     HEADER = 0xFF
 
     def pack(self) -> bytes:
-        ax = (self.axes + [0.0]*6)[:6]
-        payload = struct.pack('<HffffffB', self.buttons, *ax, self.dpad_code)
-        checksum = sum(payload) & 0xFF
-        return struct.pack('<B', self.HEADER) + payload + struct.pack('<B', checksum)
+        ax = self.axes
+        if len(ax) != 6:
+            # Slow path: pad/trim only when the caller didn't supply 6 axes
+            ax = (list(ax) + [0.0]*6)[:6]
+        buf = bytearray(_PKT.size)
+        _PKT.pack_into(buf, 0, self.HEADER, self.buttons, *ax, self.dpad_code, 0)
+        # Checksum covers the payload only; the placeholder byte is still 0,
+        # so summing the whole buffer and subtracting the header avoids
+        # materializing a memoryview slice.
+        buf[-1] = (sum(buf) - self.HEADER) & 0xFF
+        return bytes(buf)
+
+    @staticmethod
+    def pack_full(buttons: int, axes, dpad_code: int) -> bytes:
+        """Pack a frame assuming the fixed FrameState layout (exactly 6 axes).
+
+        Hot-path variant of pack(): no Packet instance, no padding branch.
+        """
+        buf = bytearray(_PKT.size)
+        _PKT.pack_into(buf, 0, Packet.HEADER, buttons, *axes, dpad_code, 0)
+        buf[-1] = (sum(buf) - Packet.HEADER) & 0xFF
+        return bytes(buf)
 
 
 class SerialInterface:
-    def __init__(self, port, baud=115200):
+    def __init__(self, port, baud=115200, bufferize=False,
+                 flush_threshold=256, max_latency_s=0.002, threaded=False):
+        """
+        With bufferize=True, frames are staged and written in batches:
+        one USB transaction per flush instead of one per frame. A flush
+        happens when the staging buffer reaches flush_threshold bytes or
+        max_latency_s has elapsed since the last one, bounding added
+        input latency. Default is unbuffered (write per frame).
+
+        With threaded=True, send_frame never touches the port itself:
+        frames go into a 4-deep drop-oldest ring and a daemon writer
+        thread drains it, so a stalled USB VCP write cannot block the
+        poll loop. The port is opened with write_timeout=0 in this mode.
+        threaded takes precedence over bufferize.
+        """
+        self.bufferize = bufferize
+        self._flush_threshold = flush_threshold
+        self._max_latency_s = max_latency_s
+        self._staging = bytearray()
+        self._last_flush = time.monotonic()
+
+        self.threaded = threaded
+        self._tx_ring = collections.deque(maxlen=4)
+        self._writer = None
+        self._running = False
+
         if not port or (isinstance(port, str) and port.upper().startswith("MOCK")):
             self.ser = None
             print(f"[SerialInterface] Mock/no-serial mode for port={port}")
         else:
             if serial is None:
                 raise RuntimeError("pyserial is required to open real serial ports")
-            self.ser = serial.Serial(port, baud, timeout=0.1)
+            self.ser = serial.Serial(port, baud, timeout=0.1,
+                                     write_timeout=0 if threaded else None)
             print(f"[SerialInterface] Connected to {port}")
 
+        if self.threaded and self.ser:
+            self._start_writer()
+
     def send_frame(self, frame_state: FrameState):
         if not isinstance(frame_state, FrameState):
             raise TypeError("Expected FrameState instance")
 
-        packet = Packet(
-            buttons=self.buttons_to_bitmask(frame_state.buttons),
-            axes=list(frame_state.axes),
-            dpad_code=self.dpad_encode(frame_state.dpad)
-        )
-
         if not self.ser:
             return  # mock / no-hardware mode: drop packet silently
 
-        self.ser.write(packet.pack())
+        # FrameState axes are always exactly 6 wide, so skip the Packet
+        # dataclass and its padding branch entirely
+        data = Packet.pack_full(
+            self.buttons_to_bitmask(frame_state.buttons),
+            frame_state.axes,
+            self.dpad_encode(frame_state.dpad)
+        )
+
+        if self.threaded:
+            # maxlen evicts the oldest frame automatically on overflow
+            self._tx_ring.append(data)
+            return
+
+        if not self.bufferize:
+            self.ser.write(data)
+            return
+
+        self._staging += data
+        now = time.monotonic()
+        if (len(self._staging) >= self._flush_threshold
+                or now - self._last_flush >= self._max_latency_s):
+            self.flush()
+
+    def _start_writer(self):
+        self._running = True
+        self._writer = threading.Thread(target=self._drain_tx, daemon=True)
+        self._writer.start()
+
+    def _drain_tx(self):
+        """Writer-thread loop: drain the TX ring into the port."""
+        while self._running:
+            if self._tx_ring:
+                try:
+                    self.ser.write(self._tx_ring.popleft())
+                except IndexError:
+                    pass  # lost a race with ring eviction
+                except Exception:
+                    # Port busy or transient error: the frame is stale by
+                    # the time it would retry, so drop it and back off
+                    time.sleep(0.0005)
+            else:
+                time.sleep(0.0005)
+
+    def flush(self):
+        """Write any staged frames to the port immediately."""
+        if self._staging and self.ser:
+            self.ser.write(bytes(self._staging))
+            self._staging.clear()
+        self._last_flush = time.monotonic()
 
     def buttons_to_bitmask(self, buttons):
-        mask = 0
-        for i, pressed in enumerate(buttons):
-            if pressed:
-                mask |= (1 << i)
-        return mask & 0xFFFF
+        b = buttons if type(buttons) is tuple else tuple(buttons)
+        mask = _BUTTONS_LUT.get(b)
+        if mask is not None:
+            return mask
+        if len(b) == 10:
+            # Unrolled fold over the standard 10-button layout: no loop or
+            # iterator overhead on the per-frame send path.
+            mask = (0 | (b[0] and 1) | (b[1] and 2) | (b[2] and 4) | (b[3] and 8) |
+                    (b[4] and 16) | (b[5] and 32) | (b[6] and 64) | (b[7] and 128) |
+                    (b[8] and 256) | (b[9] and 512))
+        else:
+            mask = 0
+            for i, pressed in enumerate(b):
+                if pressed:
+                    mask |= (1 << i)
+            mask &= 0xFFFF
+        if len(_BUTTONS_LUT) < 1024:
+            _BUTTONS_LUT[b] = mask
+        return mask
 
     def dpad_encode(self, dpad):
-        hx, hy = dpad
-        return (hx + 1) + (hy + 1) * 3
+        code = _DPAD_LUT.get(dpad if type(dpad) is tuple else tuple(dpad))
+        if code is None:
+            hx, hy = dpad
+            code = (hx + 1) + (hy + 1) * 3
+        return code
 
     def close(self):
+        if self._running:
+            self._running = False
+            if self._writer:
+                self._writer.join(timeout=0.1)
         if self.ser:
+            self.flush()
             self.ser.close()
\ No newline at end of file
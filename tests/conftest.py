@@ -1,6 +1,5 @@
 """Shared pytest fixtures for XSerialOne tests."""
 import pytest
-import copy
 from XSerialOne.base import BaseGenerator, BaseModifier, FrameState
 
 class MockGenerator(BaseGenerator):
@@ -19,7 +18,9 @@ class MockModifier(BaseModifier):
     """Test modifier that applies configurable transforms."""
     def __init__(self, transform_fn=None):
         super().__init__()
-        self.transform_fn = transform_fn or (lambda x: copy.deepcopy(x))
+        # FrameState is frozen (immutable tuples), so identity is a safe
+        # default pass-through - no copy needed
+        self.transform_fn = transform_fn or (lambda x: x)
     
     def update(self, state: FrameState) -> FrameState:
         return self.transform_fn(state)
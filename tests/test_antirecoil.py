@@ -2,6 +2,7 @@
 import pytest
 from XSerialOne.base import FrameState
 from XSerialOne.modules.antirecoil import BasicAntiRecoilModifier
+from XSerialOne.modules.deadzones import DeadzoneModifier, HairTriggers
 from XSerialOne.frame_constants import Axis
 
 def test_antirecoil_initialization():
@@ -161,5 +162,32 @@ def test_rapid_trigger_changes(basic_frame_state):
                 assert abs(current_recoil - (modifier.recoil_strength * trigger)) < 0.0001
             else:
                 assert current_recoil == 0
-        
-        previous_recoil = current_recoil
\ No newline at end of file
+
+        previous_recoil = current_recoil
+
+@pytest.mark.parametrize("n", [100, 10_000])
+@pytest.mark.parametrize("make_modifier", [
+    BasicAntiRecoilModifier, DeadzoneModifier, HairTriggers,
+])
+def test_update_perf_guard(make_modifier, n):
+    """Perf guardrail: update() must stay O(1) per call.
+
+    Not a benchmark - the 50us/update budget is ~100x the real cost, so
+    it only trips if a modifier starts accumulating per-frame history.
+    """
+    import time
+
+    modifier = make_modifier()
+    # Cycle distinct states so single-slot memos don't trivially shortcut
+    states = [
+        FrameState(axes=(0.0, 0.0, 0.05 * i, -0.05 * i, 0.0,
+                         (i * 32 - 127.5) / 127.5))
+        for i in range(8)
+    ]
+
+    start = time.perf_counter()
+    for i in range(n):
+        modifier.update(states[i & 7])
+    elapsed = time.perf_counter() - start
+
+    assert elapsed / n < 50e-6
\ No newline at end of file
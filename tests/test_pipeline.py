@@ -1,9 +1,19 @@
 """Tests for pipeline.py functionality."""
+import random
+
 import pytest
-from XSerialOne.pipeline import InputPipeline
-from XSerialOne.serial_interface import SerialInterface
+
 from XSerialOne.base import FrameState
 from XSerialOne.frame_constants import Axis, Button
+from XSerialOne.modules import (
+    BasicAntiRecoilModifier,
+    DeadzoneModifier,
+    FusedAimModifier,
+    HairTriggers,
+)
+from XSerialOne.pipeline import InputPipeline
+from XSerialOne.serial_interface import SerialInterface
+
 
 def test_pipeline_combine_generators(mock_generator, basic_frame_state):
     """Test that pipeline correctly combines generator outputs."""
@@ -21,14 +31,10 @@ def test_pipeline_combine_generators(mock_generator, basic_frame_state):
 def test_pipeline_apply_modifiers(mock_modifier, basic_frame_state):
     """Test that modifiers are applied in sequence."""
     def modifier1(state: FrameState) -> FrameState:
-        axes = list(state.axes)
-        axes[Axis.LEFTSTICKX] = 1.0
-        return FrameState(buttons=state.buttons, axes=tuple(axes), dpad=state.dpad)
+        return state.with_axis(Axis.LEFTSTICKX, 1.0)
 
     def modifier2(state: FrameState) -> FrameState:
-        buttons = list(state.buttons)
-        buttons[Button.A] = True
-        return FrameState(buttons=tuple(buttons), axes=state.axes, dpad=state.dpad)
+        return state.with_button(Button.A, True)
     
     pipeline = InputPipeline()
     pipeline.add_modifier(mock_modifier(modifier1))
@@ -47,5 +53,60 @@ def test_pipeline_update_sends_to_serial(mock_generator, mock_serial, basic_fram
     
     pipeline.add_generator(mock_generator([basic_frame_state]))
     pipeline.update()
-    
-    assert len(mock_serial.written_data) == 1
\ No newline at end of file
+
+    assert len(mock_serial.written_data) == 1
+
+def test_pipeline_run_loop_adaptive_polling(mock_generator, basic_frame_state, monkeypatch):
+    """Test that run_loop backs off to the idle interval when frames stop changing."""
+    pipeline = InputPipeline(min_poll_interval_s=0.001, idle_poll_interval_s=0.008)
+    pipeline.add_generator(mock_generator([basic_frame_state]))
+
+    clock = {"t": 0.0}
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock["t"] += seconds
+        if len(sleeps) >= 12:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr("XSerialOne.pipeline.time.monotonic", lambda: clock["t"])
+    monkeypatch.setattr("XSerialOne.pipeline.time.sleep", fake_sleep)
+
+    pipeline.run_loop()  # exits cleanly via the KeyboardInterrupt handler
+
+    # Identical frames every tick: starts fast, settles on the idle interval
+    assert sleeps[0] == pytest.approx(pipeline.min_poll_interval_s)
+    assert sleeps[-1] == pytest.approx(pipeline.idle_poll_interval_s)
+
+def test_pipeline_compile_modifiers_fuses_aim_chain():
+    """Test that compile_modifiers swaps the aim chain for an equivalent fused pass."""
+    def build():
+        pipeline = InputPipeline()
+        pipeline.add_modifier(DeadzoneModifier())
+        pipeline.add_modifier(BasicAntiRecoilModifier())
+        pipeline.add_modifier(HairTriggers())
+        return pipeline
+
+    chained = build()
+    fused = build()
+    assert fused.compile_modifiers() is True
+    assert len(fused.modifiers) == 1
+    assert isinstance(fused.modifiers[0], FusedAimModifier)
+
+    rng = random.Random(1234)
+    for _ in range(500):
+        # Continuous samples, including off-grid trigger values: the
+        # fused path must match the chain for arbitrary float inputs
+        axes = tuple(rng.uniform(-1.0, 1.0) for _ in range(6))
+        state = FrameState(axes=axes)
+        assert chained.apply_modifiers(state) == fused.apply_modifiers(state)
+
+def test_pipeline_compile_modifiers_leaves_other_chains():
+    """Test that compile_modifiers does not touch non-matching chains."""
+    pipeline = InputPipeline()
+    pipeline.add_modifier(DeadzoneModifier())
+    pipeline.add_modifier(HairTriggers())
+
+    assert pipeline.compile_modifiers() is False
+    assert len(pipeline.modifiers) == 2
\ No newline at end of file
@@ -43,6 +43,29 @@ def test_no_controller(generator):
     assert all(a == 0.0 for a in state.axes)
     assert state.dpad == (0, 0)
 
+def test_absent_controller_skips_polling(generator):
+    """Test that polling backs off after a disconnect instead of re-querying."""
+    generator.xinput.XInputGetState.return_value = 1167  # ERROR_DEVICE_NOT_CONNECTED
+
+    for _ in range(10):
+        state = generator.generate()
+        assert all(a == 0.0 for a in state.axes)
+
+    # Only the first generate() should have hit XInput; the rest return
+    # the cached default until the retry interval elapses
+    assert generator.xinput.XInputGetState.call_count == 1
+
+def test_devices_absent_skips_xinput(generator):
+    """Test that generate() never touches XInput with no devices enumerated."""
+    generator._devices_present = False
+    generator._presence_recheck_at = float("inf")
+
+    for _ in range(5):
+        state = generator.generate()
+        assert all(a == 0.0 for a in state.axes)
+
+    assert generator.xinput.XInputGetState.call_count == 0
+
 def test_button_mapping(generator):
     """Test button bit mapping and state conversion."""
     def create_button_state(button_value):